@@ -0,0 +1,289 @@
+import threading
+import unittest
+from unittest import mock
+import numpy as np
+from qunetsim.components.host import Host
+from qunetsim.objects import Qubit
+
+from qunetsim.backends import QuTipBackend
+from qunetsim.backends.qutip_backend import cupy, kernels
+
+
+class TestQuTipBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = QuTipBackend()
+        self.alice = Host('Alice', self.backend)
+        self.bob = Host('Bob', self.backend)
+
+    def test_multiple_backends(self):
+        backend = QuTipBackend()
+        _ = Host('Eve', backend)
+        self.assertEqual(str(self.backend._hosts), str(backend._hosts))
+
+    def test_single_gates(self):
+        q = Qubit(self.alice)
+        q.X()
+        self.assertEqual(1, q.measure())
+
+        q = Qubit(self.alice)
+        q.H()
+        q.H()
+        self.assertEqual(0, q.measure())
+
+        q = Qubit(self.alice)
+        q.H()
+        q.Z()
+        q.H()
+        self.assertEqual(1, q.measure())
+
+    def test_gate_fusion(self):
+        q = Qubit(self.alice)
+        for _ in range(2 * QuTipBackend.QubitCollection.MAX_FUSED_GATES + 1):
+            q.X()
+        self.assertEqual(1, q.measure())
+
+        q = Qubit(self.alice)
+        q.H()
+        for _ in range(4):
+            q.T()
+        q.H()
+        self.assertEqual(1, q.measure())
+
+    def test_two_qubit_gate_fusion(self):
+        q1 = Qubit(self.alice)
+        q2 = Qubit(self.alice)
+        q1.X()
+        for _ in range(2 * QuTipBackend.QubitCollection.MAX_FUSED_GATES + 1):
+            q1.cnot(q2)
+        q2.H()
+        q2.cphase(q1)
+        q2.H()
+        self.assertEqual(1, q1.measure())
+        self.assertEqual(0, q2.measure())
+
+    def test_gate_on_collection(self):
+        # The gate has to act on the right qubit of a larger state.
+        qubits = [Qubit(self.alice) for _ in range(3)]
+        self.backend.cnot(qubits[0], qubits[1])
+        self.backend.cnot(qubits[0], qubits[2])
+        qubits[1].X()
+        self.assertEqual([0, 1, 0], [q.measure() for q in qubits])
+
+    def test_cnot(self):
+        for _ in range(5):
+            q1 = Qubit(self.alice)
+            q2 = Qubit(self.alice)
+            q1.H()
+            q1.cnot(q2)
+            self.assertEqual(q1.measure(), q2.measure())
+
+    def test_epr_generation(self):
+        for _ in range(5):
+            q1 = self.backend.create_EPR(self.alice.host_id, self.bob.host_id)
+            q2 = self.backend.receive_epr(
+                self.bob.host_id, self.alice.host_id, q_id=q1.id)
+            self.assertEqual(q1.id, q2.id)
+            self.assertEqual(self.backend.measure(q1, False),
+                             self.backend.measure(q2, False))
+
+    def test_non_destructive_measurement(self):
+        q = Qubit(self.alice)
+        q.H()
+        res = q.measure(non_destructive=True)
+        self.assertEqual(res, q.measure(non_destructive=True))
+        self.assertEqual(res, q.measure())
+
+    def test_density_operator(self):
+        q1 = self.backend.create_EPR(self.alice.host_id, self.bob.host_id)
+        q2 = self.backend.receive_epr(
+            self.bob.host_id, self.alice.host_id, q_id=q1.id)
+
+        density_operator = self.backend.density_operator(q1)
+        expected = np.diag([0.5, 0.5])
+        self.assertTrue(np.allclose(density_operator, expected))
+
+        density_operator = self.backend.density_operator([q1, q2])
+        expected = np.zeros((4, 4))
+        expected[0, 0] = expected[0, 3] = expected[3, 0] = expected[3, 3] = 0.5
+        self.assertTrue(np.allclose(density_operator, expected))
+
+        self.backend.measure(q1, False)
+        self.backend.measure(q2, False)
+
+    def _assert_queued_gates(self):
+        # Queues different gates on three qubits of one collection, which
+        # are all applied when the density operator is computed.
+        qubits = [Qubit(self.alice) for _ in range(3)]
+        self.backend.cnot(qubits[0], qubits[1])
+        self.backend.cnot(qubits[0], qubits[2])
+        self.backend.density_operator(qubits)
+        qubits[0].H()
+        qubits[1].X()
+        self.backend.rx(qubits[2], np.pi / 2)
+        density_operator = self.backend.density_operator(qubits)
+
+        state = np.kron(np.kron(np.array([1, 1]) / np.sqrt(2), np.array([0, 1])),
+                        np.array([1, -1j]) / np.sqrt(2))
+        expected = np.outer(state, state.conj())
+        self.assertTrue(np.allclose(density_operator, expected))
+        for q in qubits:
+            q.measure()
+
+    def test_queued_gates_on_several_qubits(self):
+        self._assert_queued_gates()
+
+    @unittest.skipIf(kernels is None, 'numba is not installed')
+    def test_queued_gates_above_tile(self):
+        # Tiles of four amplitudes, the gate on the first qubit is applied
+        # on its own and the others in one tiled pass.
+        with mock.patch.object(kernels, 'TILE_BYTES', 64):
+            self._assert_queued_gates()
+
+    def test_custom_gate(self):
+        q = Qubit(self.alice)
+        gate = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+        self.backend.custom_gate(q, gate)
+        # the queued gate must not change with the array of the caller
+        gate[:] = np.eye(2)
+        density_operator = self.backend.density_operator(q)
+        self.assertTrue(np.allclose(density_operator, np.diag([0, 1])))
+
+        with self.assertRaises(ValueError):
+            self.backend.custom_gate(q, np.eye(4))
+        q.measure()
+
+    def test_rotations(self):
+        q = Qubit(self.alice)
+        self.backend.ry(q, np.pi / 2)
+        density_operator = self.backend.density_operator(q)
+        self.assertTrue(np.allclose(density_operator, 0.5 * np.ones((2, 2))))
+        self.backend.rz(q, np.pi)
+        density_operator = self.backend.density_operator(q)
+        expected = 0.5 * np.array([[1, -1], [-1, 1]])
+        self.assertTrue(np.allclose(density_operator, expected))
+        q.measure()
+
+    def test_complex_rotation(self):
+        q = Qubit(self.alice)
+        self.backend.rx(q, np.pi / 2)
+        density_operator = self.backend.density_operator(q)
+        expected = 0.5 * np.array([[1, 1j], [-1j, 1]])
+        self.assertTrue(np.allclose(density_operator, expected))
+        q.measure()
+
+    def test_complex_two_qubit_gate(self):
+        q1 = Qubit(self.alice)
+        q2 = Qubit(self.alice)
+        q1.H()
+        # exp(-i theta X X), X X squares to the identity. Unlike X Y the
+        # generator is real, so the gate is complex.
+        theta = 0.3
+        x = np.array([[0, 1], [1, 0]])
+        gate = np.cos(theta) * np.eye(4) - 1j * np.sin(theta) * np.kron(x, x)
+        self.backend.custom_two_qubit_gate(q1, q2, gate)
+        density_operator = self.backend.density_operator([q1, q2])
+
+        state = gate @ np.kron(np.array([1, 1]) / np.sqrt(2), np.array([1, 0]))
+        expected = np.outer(state, state.conj())
+        self.assertTrue(np.allclose(density_operator, expected))
+        q1.measure()
+        q2.measure()
+
+    def test_custom_two_qubit_gate(self):
+        q1 = Qubit(self.alice)
+        q2 = Qubit(self.alice)
+        # X on the first qubit
+        gate = np.eye(4, dtype=np.complex128)[[2, 3, 0, 1]]
+        self.backend.custom_two_qubit_gate(q1, q2, gate)
+        # the queued gate must not change with the array of the caller
+        gate[:] = np.eye(4)
+        density_operator = self.backend.density_operator(q1)
+        self.assertTrue(np.allclose(density_operator, np.diag([0, 1])))
+
+        with self.assertRaises(ValueError):
+            self.backend.custom_two_qubit_gate(q1, q2, np.eye(2))
+        q1.measure()
+        q2.measure()
+
+    def test_single_precision(self):
+        backend = QuTipBackend(dtype=np.complex64)
+        q1 = backend.create_EPR(self.alice.host_id, self.bob.host_id)
+        q2 = backend.receive_epr(
+            self.bob.host_id, self.alice.host_id, q_id=q1.id)
+        backend.X(q1)
+        density_operator = backend.density_operator(q2)
+        self.assertEqual(np.complex64, density_operator.dtype)
+        self.assertTrue(np.allclose(density_operator, np.diag([0.5, 0.5])))
+        self.assertEqual(1 - backend.measure(q1, False),
+                         backend.measure(q2, False))
+
+    def test_invalid_device(self):
+        with self.assertRaises(ValueError):
+            QuTipBackend(device='tpu')
+
+    @unittest.skipIf(cupy is None, 'cupy is not installed')
+    def test_cuda_device(self):
+        backend = QuTipBackend(device='cuda')
+        q1 = backend.create_EPR(self.alice.host_id, self.bob.host_id)
+        q2 = backend.receive_epr(
+            self.bob.host_id, self.alice.host_id, q_id=q1.id)
+        density_operator = backend.density_operator([q1, q2])
+        self.assertIsInstance(density_operator, np.ndarray)
+        expected = np.zeros((4, 4))
+        expected[0, 0] = expected[0, 3] = expected[3, 0] = expected[3, 3] = 0.5
+        self.assertTrue(np.allclose(density_operator, expected))
+
+        backend.cnot(q1, q2)
+        density_operator = backend.density_operator(q2)
+        self.assertTrue(np.allclose(density_operator, np.diag([1, 0])))
+        self.assertEqual(0, backend.measure(q2, False))
+        density_operator = backend.density_operator(q1)
+        self.assertTrue(np.allclose(density_operator, 0.5 * np.ones((2, 2))))
+        backend.H(q1)
+        self.assertEqual(0, backend.measure(q1, False))
+
+    @unittest.skipIf(kernels is None, 'numba is not installed')
+    def test_tune_thresholds(self):
+        self.backend.start()
+        for name, _, _, _ in kernels._KERNELS:
+            self.assertIsNotNone(kernels._thresholds.get_from_dict(name))
+
+    @unittest.skipIf(kernels is None, 'numba is not installed')
+    def test_parallel_kernels_from_threads(self):
+        # Hosts apply gates from their own threads, the parallel kernels
+        # must not be run concurrently.
+        thresholds = dict(kernels._thresholds.dict)
+        for name, _, _, _ in kernels._KERNELS:
+            kernels._thresholds.add_to_dict(name, 0)
+        errors = []
+
+        def run(host):
+            try:
+                for _ in range(20):
+                    qubits = [Qubit(host) for _ in range(3)]
+                    qubits[0].H()
+                    qubits[0].cnot(qubits[1])
+                    qubits[0].cnot(qubits[2])
+                    qubits[1].Z()
+                    qubits[2].X()
+                    results = [q.measure() for q in qubits]
+                    if results[0] != results[1] or results[0] == results[2]:
+                        errors.append(results)
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            threads = [threading.Thread(target=run, args=(host,))
+                       for host in (self.alice, self.bob)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            kernels._thresholds.dict = thresholds
+        self.assertEqual([], errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,521 @@
+"""
+Numba compiled kernels which update the state vectors of the QuTip backend
+in place. Importing this module fails with an ImportError if numba is not
+installed, the backend then uses its NumPy implementation.
+
+Every kernel exists in a serial and a parallel version. Starting the
+threads of the parallel version only pays off for larger state vectors,
+the number of qubits from which on it is used can be tuned for the
+machine with tune_thresholds. Calls of the parallel versions are
+serialized, since the workqueue threading layer of numba aborts the
+process if they are made from several threads at the same time.
+"""
+import os
+import threading
+import time
+import numpy as np
+from numba import config, njit, prange
+from qunetsim.backends.safe_dict import SafeDict
+
+# Number of qubits from which on the parallel kernels are used if they
+# have not been tuned.
+DEFAULT_THRESHOLD = 14
+
+# Kernel name to the number of qubits from which on the parallel version is used
+_thresholds = SafeDict()
+
+# Held while a parallel kernel runs, gates are applied from the threads of
+# the hosts and protocols.
+_parallel_lock = threading.Lock()
+
+# Bytes of a tile of the state vector in which several gates are applied
+# before the next tile is loaded, about the size of a L2 cache.
+TILE_BYTES = 256 * 1024
+
+
+@njit(fastmath=True, cache=True)
+def apply_1q_serial(state, g00, g01, g10, g11, k, n):
+    """
+    Applies the single qubit gate [[g00, g01], [g10, g11]] to the qubit at
+    bit position k of a state vector of n qubits.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        g00, g01, g10, g11 (complex): Entries of the gate.
+        k (int): Bit position of the qubit, 0 is the least significant bit.
+        n (int): Number of qubits of the state vector.
+    """
+    stride = 1 << k
+    low_mask = stride - 1
+    high_mask = ~low_mask
+    for i in range(2 ** (n - 1)):
+        base = ((i & high_mask) << 1) | (i & low_mask)
+        other = base | stride
+        a = state[base]
+        b = state[other]
+        state[base] = g00 * a + g01 * b
+        state[other] = g10 * a + g11 * b
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_1q_parallel(state, g00, g01, g10, g11, k, n):
+    """
+    Parallel version of apply_1q_serial.
+    """
+    stride = 1 << k
+    low_mask = stride - 1
+    high_mask = ~low_mask
+    for i in prange(2 ** (n - 1)):
+        base = ((i & high_mask) << 1) | (i & low_mask)
+        other = base | stride
+        a = state[base]
+        b = state[other]
+        state[base] = g00 * a + g01 * b
+        state[other] = g10 * a + g11 * b
+
+
+@njit(fastmath=True, cache=True)
+def apply_diag_serial(state, d0, d1, k, n):
+    """
+    Applies the diagonal gate [[d0, 0], [0, d1]] to the qubit at bit
+    position k. If d0 is 1, only the amplitudes where the qubit is 1 are
+    touched, which halves the memory traffic of Z, T and phase gates.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        d0, d1 (complex): Diagonal entries of the gate.
+        k (int): Bit position of the qubit, 0 is the least significant bit.
+        n (int): Number of qubits of the state vector.
+    """
+    stride = 1 << k
+    low_mask = stride - 1
+    high_mask = ~low_mask
+    if d0 == 1:
+        for i in range(2 ** (n - 1)):
+            other = ((i & high_mask) << 1) | (i & low_mask) | stride
+            state[other] = d1 * state[other]
+    else:
+        for i in range(2 ** (n - 1)):
+            base = ((i & high_mask) << 1) | (i & low_mask)
+            other = base | stride
+            state[base] = d0 * state[base]
+            state[other] = d1 * state[other]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_diag_parallel(state, d0, d1, k, n):
+    """
+    Parallel version of apply_diag_serial.
+    """
+    stride = 1 << k
+    low_mask = stride - 1
+    high_mask = ~low_mask
+    if d0 == 1:
+        for i in prange(2 ** (n - 1)):
+            other = ((i & high_mask) << 1) | (i & low_mask) | stride
+            state[other] = d1 * state[other]
+    else:
+        for i in prange(2 ** (n - 1)):
+            base = ((i & high_mask) << 1) | (i & low_mask)
+            other = base | stride
+            state[base] = d0 * state[base]
+            state[other] = d1 * state[other]
+
+
+@njit(fastmath=True, cache=True)
+def apply_antidiag_serial(state, g01, g10, k, n):
+    """
+    Applies the anti-diagonal gate [[0, g01], [g10, 0]] to the qubit at bit
+    position k. If both entries are 1, as for X, the amplitudes are only
+    swapped.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        g01, g10 (complex): Off-diagonal entries of the gate.
+        k (int): Bit position of the qubit, 0 is the least significant bit.
+        n (int): Number of qubits of the state vector.
+    """
+    stride = 1 << k
+    low_mask = stride - 1
+    high_mask = ~low_mask
+    if g01 == 1 and g10 == 1:
+        for i in range(2 ** (n - 1)):
+            base = ((i & high_mask) << 1) | (i & low_mask)
+            other = base | stride
+            a = state[base]
+            state[base] = state[other]
+            state[other] = a
+    else:
+        for i in range(2 ** (n - 1)):
+            base = ((i & high_mask) << 1) | (i & low_mask)
+            other = base | stride
+            a = state[base]
+            state[base] = g01 * state[other]
+            state[other] = g10 * a
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_antidiag_parallel(state, g01, g10, k, n):
+    """
+    Parallel version of apply_antidiag_serial.
+    """
+    stride = 1 << k
+    low_mask = stride - 1
+    high_mask = ~low_mask
+    if g01 == 1 and g10 == 1:
+        for i in prange(2 ** (n - 1)):
+            base = ((i & high_mask) << 1) | (i & low_mask)
+            other = base | stride
+            a = state[base]
+            state[base] = state[other]
+            state[other] = a
+    else:
+        for i in prange(2 ** (n - 1)):
+            base = ((i & high_mask) << 1) | (i & low_mask)
+            other = base | stride
+            a = state[base]
+            state[base] = g01 * state[other]
+            state[other] = g10 * a
+
+
+@njit(fastmath=True, cache=True)
+def apply_2q_serial(state, gate, k1, k2, n):
+    """
+    Applies the two qubit gate to the qubits at bit positions k1 and k2 of
+    a state vector of n qubits. The first qubit is the more significant
+    one in the basis of the gate.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        gate (np.ndarray): 4x4 array of the gate.
+        k1 (int): Bit position of the first qubit of the gate.
+        k2 (int): Bit position of the second qubit of the gate.
+        n (int): Number of qubits of the state vector.
+    """
+    stride_1 = 1 << k1
+    stride_2 = 1 << k2
+    low_mask = min(stride_1, stride_2) - 1
+    mid_mask = ((max(stride_1, stride_2) >> 1) - 1) & ~low_mask
+    high_mask = ~(low_mask | mid_mask)
+    for i in range(2 ** (n - 2)):
+        base = ((i & high_mask) << 2) | ((i & mid_mask) << 1) | (i & low_mask)
+        i01 = base | stride_2
+        i10 = base | stride_1
+        i11 = i10 | stride_2
+        a00 = state[base]
+        a01 = state[i01]
+        a10 = state[i10]
+        a11 = state[i11]
+        state[base] = gate[0, 0] * a00 + gate[0, 1] * a01 + gate[0, 2] * a10 + gate[0, 3] * a11
+        state[i01] = gate[1, 0] * a00 + gate[1, 1] * a01 + gate[1, 2] * a10 + gate[1, 3] * a11
+        state[i10] = gate[2, 0] * a00 + gate[2, 1] * a01 + gate[2, 2] * a10 + gate[2, 3] * a11
+        state[i11] = gate[3, 0] * a00 + gate[3, 1] * a01 + gate[3, 2] * a10 + gate[3, 3] * a11
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_2q_parallel(state, gate, k1, k2, n):
+    """
+    Parallel version of apply_2q_serial.
+    """
+    stride_1 = 1 << k1
+    stride_2 = 1 << k2
+    low_mask = min(stride_1, stride_2) - 1
+    mid_mask = ((max(stride_1, stride_2) >> 1) - 1) & ~low_mask
+    high_mask = ~(low_mask | mid_mask)
+    for i in prange(2 ** (n - 2)):
+        base = ((i & high_mask) << 2) | ((i & mid_mask) << 1) | (i & low_mask)
+        i01 = base | stride_2
+        i10 = base | stride_1
+        i11 = i10 | stride_2
+        a00 = state[base]
+        a01 = state[i01]
+        a10 = state[i10]
+        a11 = state[i11]
+        state[base] = gate[0, 0] * a00 + gate[0, 1] * a01 + gate[0, 2] * a10 + gate[0, 3] * a11
+        state[i01] = gate[1, 0] * a00 + gate[1, 1] * a01 + gate[1, 2] * a10 + gate[1, 3] * a11
+        state[i10] = gate[2, 0] * a00 + gate[2, 1] * a01 + gate[2, 2] * a10 + gate[2, 3] * a11
+        state[i11] = gate[3, 0] * a00 + gate[3, 1] * a01 + gate[3, 2] * a10 + gate[3, 3] * a11
+
+
+@njit(fastmath=True, cache=True)
+def apply_1q_tiled_serial(state, gates, ks, n, tile_qubits):
+    """
+    Applies single qubit gates on different qubits tile by tile. All gates
+    are applied to a tile of 2^tile_qubits amplitudes before the next tile
+    is loaded, so the state vector is read from memory only once.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        gates (np.ndarray): Array of shape (m, 2, 2) with the gates.
+        ks (np.ndarray): Bit positions of the qubits of the gates, all
+                         smaller than tile_qubits.
+        n (int): Number of qubits of the state vector.
+        tile_qubits (int): Tiles have 2^tile_qubits amplitudes.
+    """
+    tile = 1 << tile_qubits
+    for t in range(2 ** (n - tile_qubits)):
+        offset = t * tile
+        for g in range(len(ks)):
+            stride = 1 << ks[g]
+            low_mask = stride - 1
+            high_mask = ~low_mask
+            g00 = gates[g, 0, 0]
+            g01 = gates[g, 0, 1]
+            g10 = gates[g, 1, 0]
+            g11 = gates[g, 1, 1]
+            for i in range(tile >> 1):
+                base = offset | ((i & high_mask) << 1) | (i & low_mask)
+                other = base | stride
+                a = state[base]
+                b = state[other]
+                state[base] = g00 * a + g01 * b
+                state[other] = g10 * a + g11 * b
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_1q_tiled_parallel(state, gates, ks, n, tile_qubits):
+    """
+    Parallel version of apply_1q_tiled_serial, the tiles are distributed
+    over the threads.
+    """
+    tile = 1 << tile_qubits
+    for t in prange(2 ** (n - tile_qubits)):
+        offset = t * tile
+        for g in range(len(ks)):
+            stride = 1 << ks[g]
+            low_mask = stride - 1
+            high_mask = ~low_mask
+            g00 = gates[g, 0, 0]
+            g01 = gates[g, 0, 1]
+            g10 = gates[g, 1, 0]
+            g11 = gates[g, 1, 1]
+            for i in range(tile >> 1):
+                base = offset | ((i & high_mask) << 1) | (i & low_mask)
+                other = base | stride
+                a = state[base]
+                b = state[other]
+                state[base] = g00 * a + g01 * b
+                state[other] = g10 * a + g11 * b
+
+
+def prefer_threading_layers():
+    """
+    Makes numba prefer the OpenMP and workqueue threading layers over TBB,
+    unless a layer is chosen with NUMBA_THREADING_LAYER or
+    NUMBA_THREADING_LAYER_PRIORITY. TBB hangs when the process exits if its
+    threads were first started from another thread than the main thread,
+    which happens for gates applied by hosts. The setting applies to the
+    whole process and only has an effect before the first parallel kernel
+    of numba has run.
+    """
+    if ('NUMBA_THREADING_LAYER' not in os.environ
+            and 'NUMBA_THREADING_LAYER_PRIORITY' not in os.environ):
+        config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+
+
+def _threshold(name):
+    threshold = _thresholds.get_from_dict(name)
+    if threshold is None:
+        return DEFAULT_THRESHOLD
+    return threshold
+
+
+def _run(name, n, serial, parallel, *args):
+    # Runs the serial version below the threshold of the kernel and the
+    # parallel version from it on.
+    if n < _threshold(name):
+        serial(*args)
+    else:
+        with _parallel_lock:
+            parallel(*args)
+
+
+def apply_1q(state, g00, g01, g10, g11, k, n):
+    """
+    Applies a single qubit gate, see apply_1q_serial for the arguments.
+    """
+    _run('apply_1q', n, apply_1q_serial, apply_1q_parallel,
+         state, g00, g01, g10, g11, k, n)
+
+
+def apply_diag(state, d0, d1, k, n):
+    """
+    Applies a diagonal gate, see apply_diag_serial for the arguments.
+    """
+    _run('apply_diag', n, apply_diag_serial, apply_diag_parallel,
+         state, d0, d1, k, n)
+
+
+def apply_antidiag(state, g01, g10, k, n):
+    """
+    Applies an anti-diagonal gate, see apply_antidiag_serial for the
+    arguments.
+    """
+    _run('apply_antidiag', n, apply_antidiag_serial, apply_antidiag_parallel,
+         state, g01, g10, k, n)
+
+
+def _real_view(state):
+    # Real and imaginary parts of the amplitudes as one real array of twice
+    # the length, the part is the least significant bit of the index.
+    return state.view(state.real.dtype)
+
+
+def apply_gate(state, gate, k, n):
+    """
+    Applies a single qubit gate with the kernel which fits its structure.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        gate (np.ndarray): 2x2 array of the gate.
+        k (int): Bit position of the qubit, 0 is the least significant bit.
+        n (int): Number of qubits of the state vector.
+    """
+    # compute in the precision of the state
+    cast = state.dtype.type
+    g00, g01 = cast(gate[0, 0]), cast(gate[0, 1])
+    g10, g11 = cast(gate[1, 0]), cast(gate[1, 1])
+    if g01 == 0 and g10 == 0:
+        apply_diag(state, g00, g11, k, n)
+    elif g00 == 0 and g11 == 0:
+        apply_antidiag(state, g01, g10, k, n)
+    elif not np.iscomplex(gate).any():
+        # A real gate acts on the real and imaginary parts independently.
+        # In the real view of the state the qubit is at bit k + 1, so the
+        # kernel only needs real multiplications.
+        values = _real_view(state)
+        real = values.dtype.type
+        g00, g01 = real(g00.real), real(g01.real)
+        g10, g11 = real(g10.real), real(g11.real)
+        _run('apply_1q', n, apply_1q_serial, apply_1q_parallel,
+             values, g00, g01, g10, g11, k + 1, n + 1)
+    else:
+        apply_1q(state, g00, g01, g10, g11, k, n)
+
+
+def apply_gates(state, gates, ks, n):
+    """
+    Applies single qubit gates on different qubits. The gates on qubits
+    inside one tile are applied together with one pass over the state
+    vector, gates on higher qubits one after another.
+
+    Args:
+        state (np.ndarray): State vector with 2^n amplitudes.
+        gates (list): 2x2 arrays of the gates.
+        ks (list): Bit positions of the qubits of the gates.
+        n (int): Number of qubits of the state vector.
+    """
+    tile_qubits = min(n, (TILE_BYTES // state.itemsize).bit_length() - 1)
+    tiled = [i for i, k in enumerate(ks) if k < tile_qubits]
+    for i, k in enumerate(ks):
+        if k >= tile_qubits or len(tiled) == 1:
+            apply_gate(state, gates[i], k, n)
+    if len(tiled) < 2:
+        return
+    tiled_gates = np.array([gates[i] for i in tiled], dtype=state.dtype)
+    tiled_ks = np.array([ks[i] for i in tiled], dtype=np.int64)
+    _run('apply_1q_tiled', n, apply_1q_tiled_serial, apply_1q_tiled_parallel,
+         state, tiled_gates, tiled_ks, n, tile_qubits)
+
+
+def apply_2q(state, gate, k1, k2, n):
+    """
+    Applies a two qubit gate, see apply_2q_serial for the arguments.
+    """
+    if not np.iscomplex(gate).any():
+        # real gate, applied to the real view like in apply_gate
+        values = _real_view(state)
+        gate = np.ascontiguousarray(gate.real, dtype=values.dtype)
+        _run('apply_2q', n, apply_2q_serial, apply_2q_parallel,
+             values, gate, k1 + 1, k2 + 1, n + 1)
+    else:
+        # compute in the precision of the state
+        gate = np.ascontiguousarray(gate, dtype=state.dtype)
+        _run('apply_2q', n, apply_2q_serial, apply_2q_parallel,
+             state, gate, k1, k2, n)
+
+
+def _hadamard_args(state, n):
+    h = complex(1 / np.sqrt(2))
+    return state, h, h, h, -h, n // 2, n
+
+
+def _phase_args(state, n):
+    return state, 1 + 0j, 1j, n // 2, n
+
+
+def _pauli_x_args(state, n):
+    return state, 1 + 0j, 1 + 0j, n // 2, n
+
+
+def _tiled_args(state, n):
+    tile_qubits = min(n, (TILE_BYTES // state.itemsize).bit_length() - 1)
+    h = 1 / np.sqrt(2)
+    gates = np.array([[[h, h], [h, -h]]] * 3, dtype=np.complex128)
+    ks = np.arange(3, dtype=np.int64)
+    return state, gates, ks, n, tile_qubits
+
+
+def _two_qubit_args(state, n):
+    gate = np.eye(4, dtype=np.complex128)[[0, 1, 3, 2]]
+    return state, gate, n // 2, 0, n
+
+
+# name, serial kernel, parallel kernel, function giving the arguments for
+# a state vector of n qubits
+_KERNELS = [
+    ('apply_1q', apply_1q_serial, apply_1q_parallel, _hadamard_args),
+    ('apply_diag', apply_diag_serial, apply_diag_parallel, _phase_args),
+    ('apply_antidiag', apply_antidiag_serial, apply_antidiag_parallel,
+     _pauli_x_args),
+    ('apply_2q', apply_2q_serial, apply_2q_parallel, _two_qubit_args),
+    ('apply_1q_tiled', apply_1q_tiled_serial, apply_1q_tiled_parallel,
+     _tiled_args),
+]
+
+
+def _run_time(kernel, args, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        kernel(*args)
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+
+def tune_thresholds(min_qubits=8, max_qubits=20, repeat=3):
+    """
+    Measures for every kernel from which number of qubits on the parallel
+    version is faster than the serial one. Kernels which are already
+    tuned are skipped, so only the first call takes time.
+
+    The kernels are measured on complex128 state vectors. The thresholds
+    are also used for complex64 states and for real gates, which run on
+    the real view of the state, and are only approximations there.
+
+    Args:
+        min_qubits (int): Smallest number of qubits which is measured.
+        max_qubits (int): Largest number of qubits which is measured. If
+                          the parallel version is never faster, only
+                          larger states use it.
+        repeat (int): Number of runs per measurement, the fastest counts.
+    """
+    for name, serial, parallel, make_args in _KERNELS:
+        if _thresholds.get_from_dict(name) is not None:
+            continue
+        threshold = max_qubits + 1
+        for n in range(min_qubits, max_qubits + 1):
+            state = np.zeros(2 ** n, dtype=np.complex128)
+            state[0] = 1
+            args = make_args(state, n)
+            # first calls compile or load the kernels
+            serial(*args)
+            with _parallel_lock:
+                parallel(*args)
+                parallel_time = _run_time(parallel, args, repeat)
+            if parallel_time < _run_time(serial, args, repeat):
+                threshold = n
+                break
+        _thresholds.add_to_dict(name, threshold)
@@ -4,23 +4,20 @@ class Backend(object):
     """
 
     def __init__(self):
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def start(self, **kwargs):
         """
         Starts Backends which have to run in an own thread or process before they
         can be used.
         """
-        raise EnvironmentError("This is only an interface, not \
-                        an actual implementation!")
+        raise NotImplementedError
 
     def stop(self):
         """
         Stops Backends which are running in an own thread or process.
         """
-        raise EnvironmentError("This is only an interface, not \
-                        an actual implementation!")
+        raise NotImplementedError
 
     def add_host(self, host):
         """
@@ -29,8 +26,7 @@ class Backend(object):
         Args:
             host (Host): New Host which should be added.
         """
-        raise EnvironmentError("This is only an interface, not \
-                        an actual implementation!")
+        raise NotImplementedError
 
     def create_qubit(self, host_id):
         """
@@ -42,8 +38,7 @@ class Backend(object):
         Returns:
             Qubit of backend type.
         """
-        raise EnvironmentError("This is only an interface, not \
-                        an actual implementation!")
+        raise NotImplementedError
 
     def send_qubit_to(self, qubit, from_host_id, to_host_id):
         """
@@ -54,8 +49,7 @@ class Backend(object):
             from_host_id (str): From the starting host.
             to_host_id (str): New host of the qubit.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def create_EPR(self, host_a_id, host_b_id, q_id=None, block=False):
         """
@@ -70,8 +64,7 @@ class Backend(object):
             Returns a qubit. The qubit belongs to host a. To get the second
             qubit of host b, the receive_epr function has to be called.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def receive_epr(self, host_id, sender_id, q_id=None, block=False):
         """
@@ -85,8 +78,7 @@ class Backend(object):
         Returns:
             Returns an EPR qubit with the other Host.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     ##########################
     #   Gate definitions    #
@@ -99,8 +91,7 @@ class Backend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def X(self, qubit):
         """
@@ -109,8 +100,7 @@ class Backend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def Y(self, qubit):
         """
@@ -119,8 +109,7 @@ class Backend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def Z(self, qubit):
         """
@@ -129,8 +118,7 @@ class Backend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def H(self, qubit):
         """
@@ -139,8 +127,7 @@ class Backend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def T(self, qubit):
         """
@@ -149,8 +136,7 @@ class Backend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def rx(self, qubit, phi):
         """
@@ -160,8 +146,7 @@ class Backend(object):
             qubit (Qubit): Qubit on which gate should be applied to.
             phi (float): Amount of rotation in Rad.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def ry(self, qubit, phi):
         """
@@ -171,8 +156,7 @@ class Backend(object):
             qubit (Qubit): Qubit on which gate should be applied to.
             phi (float): Amount of rotation in Rad.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def rz(self, phi):
         """
@@ -182,8 +166,7 @@ class Backend(object):
             qubit (Qubit): Qubit on which gate should be applied to.
             phi (float): Amount of rotation in Rad.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def cnot(self, qubit, target):
         """
@@ -193,8 +176,7 @@ class Backend(object):
             qubit (Qubit): Qubit to control cnot.
             target (Qubit): Qubit on which the cnot gate should be applied.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def cphase(self, qubit, target):
         """
@@ -204,8 +186,7 @@ class Backend(object):
             qubit (Qubit): Qubit to control cphase.
             target (Qubit): Qubit on which the cphase gate should be applied.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def custom_gate(self, qubit, gate):
         """
@@ -215,8 +196,7 @@ class Backend(object):
             qubit(Qubit): Qubit to which the gate is applied.
             gate(np.ndarray): 2x2 array of the gate.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def custom_controlled_gate(self, qubit, target, gate):
         """
@@ -227,8 +207,7 @@ class Backend(object):
             target(Qubit): Qubit on which the gate is applied.
             gate(nd.array): 2x2 array for the gate applied to target.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def custom_controlled_two_qubit_gate(self, qubit, target_1, target_2, gate):
         """
@@ -240,8 +219,7 @@ class Backend(object):
             target_2 (Qubit): Qubit on which the gate is applied.
             gate (nd.array): 4x4 array for the gate applied to target.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def custom_two_qubit_gate(self, qubit1, qubit2, gate):
         """
@@ -252,8 +230,7 @@ class Backend(object):
             qubit2(Qubit): Second qubit of the gate.
             gate(np.ndarray): 4x4 array for the gate applied.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def density_operator(self, qubit):
         """
@@ -266,8 +243,7 @@ class Backend(object):
         Returns:
             np.ndarray: The density operator of the qubit.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def measure(self, qubit, non_destructive):
         """
@@ -281,8 +257,7 @@ class Backend(object):
         Returns:
             The value which has been measured.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
 
     def release(self, qubit):
         """
@@ -291,5 +266,4 @@ class Backend(object):
         Args:
             qubit (Qubit): The qubit which should be released.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        raise NotImplementedError
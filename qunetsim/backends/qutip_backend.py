@@ -1,19 +1,93 @@
 from .safe_dict import SafeDict
 from .rw_lock import RWLock
 from qunetsim.objects.qubit import Qubit
-from queue import Queue
+from collections import deque
+from functools import lru_cache
 import numpy as np
 import uuid
 
 try:
-    import qutip
-    from qutip.cy.spmath import zcsr_kron
-    from qutip.qip.operations import cnot, snot, gate_expand_1toN, gate_expand_2toN, \
-        rx, ry, rz, csign
+    from . import _qutip_kernels as kernels
 except ImportError:
-    raise RuntimeError(
-        'To use QuTip as a backend, you need to first install the Python package '
-        '\'qutip\' (e.g. run \'pip install qutip\'.')
+    # numba is not installed, gates are applied with NumPy
+    kernels = None
+
+try:
+    import cupy
+except ImportError:
+    # only needed to simulate on a GPU
+    cupy = None
+
+# Byte alignment of the state vectors, matches the width of AVX-512 registers.
+_ALIGNMENT = 64
+
+
+def _empty_state(size, dtype=np.complex128):
+    """
+    Allocates an uninitialized, C-contiguous complex vector whose first
+    element lies on a 64 byte boundary.
+
+    Args:
+        size (int): Number of amplitudes.
+        dtype (np.dtype): Type of the amplitudes.
+
+    Returns:
+        np.ndarray: The aligned vector.
+    """
+    n_bytes = size * np.dtype(dtype).itemsize
+    buffer = np.empty(n_bytes + _ALIGNMENT, dtype=np.uint8)
+    offset = -buffer.ctypes.data % _ALIGNMENT
+    return buffer[offset:offset + n_bytes].view(dtype)
+
+
+def _gate(matrix):
+    gate = np.array(matrix, dtype=np.complex128)
+    gate.setflags(write=False)
+    return gate
+
+
+_X = _gate([[0, 1], [1, 0]])
+_Y = _gate([[0, -1j], [1j, 0]])
+_Z = _gate([[1, 0], [0, -1]])
+_H = _gate(np.array([[1, 1], [1, -1]]) / np.sqrt(2))
+_T = _gate([[1, 0], [0, np.exp(1j * np.pi / 4)]])
+_I = _gate(np.eye(2))
+# Two qubit gates, the first qubit is the control qubit.
+_CNOT = _gate([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+_CPHASE = _gate(np.diag([1, 1, 1, -1]))
+_SWAP = _gate([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+# State vector of the Bell state (|00> + |11>) / sqrt(2) of an EPR pair
+_BELL = np.array([1, 0, 0, 1], dtype=np.complex128) / np.sqrt(2)
+_BELL.setflags(write=False)
+
+
+@lru_cache(maxsize=1024)
+def _rotation(axis, phi):
+    """
+    Gives the read only matrix of a rotation around the x, y or z axis.
+    Protocols often reuse the same angles, so the matrices are cached.
+
+    Args:
+        axis (str): 'x', 'y' or 'z'.
+        phi (float): Amount of rotation in Rad.
+
+    Returns:
+        np.ndarray: The 2x2 matrix of the rotation.
+    """
+    cos = np.cos(phi / 2)
+    sin = np.sin(phi / 2)
+    if axis == 'x':
+        return _gate([[cos, -1j * sin], [-1j * sin, cos]])
+    if axis == 'y':
+        return _gate([[cos, -sin], [sin, cos]])
+    return _gate([[np.exp(-0.5j * phi), 0], [0, np.exp(0.5j * phi)]])
+
+
+# Hosts and entangled qubits are shared by all instances of the backend.
+_hosts = SafeDict()
+# keys are from : to, where from is the host calling create EPR
+_entanglement_qubits = SafeDict()
 
 
 class QuTipBackend(object):
@@ -22,13 +96,46 @@ class QuTipBackend(object):
     """
 
     class QubitCollection(object):
+        # Maximum number of gates which are fused on one qubit or on one
+        # pair of qubits before the product is applied to the state vector.
+        MAX_FUSED_GATES = 32
 
-        def __init__(self, name):
+        def __init__(self, name, xp=np, dtype=np.complex128):
             # initialize as a qubit in state |0>
             self._rwlock = RWLock()
+            # array module holding the state vector, numpy or cupy
+            self._xp = xp
+            self._dtype = dtype
             self.N = 1
             self._qubit_names = [name]
-            self.data = qutip.qutip.fock_dm(2, 0)
+            # single qubit gates which are not yet applied, qubit name to
+            # (fused gate, number of fused gates)
+            self._pending = {}
+            # gates on one pair of qubits which are not yet applied,
+            # [first name, second name, list of (kind, 4x4 gate on first
+            # and second qubit, control name, target name)]
+            self._block = None
+            self.data = self._empty(2)
+            self.data[0] = 1
+            self.data[1] = 0
+
+        @classmethod
+        def from_state(cls, qubit_names, state, xp=np, dtype=np.complex128):
+            """
+            Creates a collection of the qubits which is in the given state.
+
+            Args:
+                qubit_names (list): Names of the qubits, the first qubit is
+                                    the most significant bit of the state.
+                state (np.ndarray): State vector with 2^len(qubit_names)
+                                    amplitudes, it is copied.
+            """
+            collection = cls(qubit_names[0], xp, dtype)
+            collection.N = len(qubit_names)
+            collection._qubit_names = list(qubit_names)
+            collection.data = collection._empty(len(state))
+            collection.data[...] = xp.asarray(state)
+            return collection
 
         @property
         def qubit_names(self):
@@ -36,64 +143,222 @@ class QuTipBackend(object):
 
         def add_qubit(self, qubit):
             """
-            Calculates the tensor product using the implementation
-            of QuTip.
-            Modified version of qutip tensor function,
-            See http://qutip.org/docs/4.0.2/modules/qutip/tensor.html
+            Calculates the tensor product of the two state vectors. The
+            qubits of the added collection are appended after the qubits
+            of this collection.
             """
+            # only one block of two qubit gates can be kept
+            qubit._lock()
+            qubit._flush_block()
+            qubit._unlock()
             self._lock()
-            self.data = qutip.tensor(self.data, qubit.data)
+            data = self._empty(self.data.size * qubit.data.size)
+            self._xp.multiply(self.data[:, None], qubit.data[None, :],
+                              out=data.reshape(self.data.size, qubit.data.size))
+            self.data = data
             self.N = self.N + qubit.N
             self._qubit_names = self._qubit_names + qubit._qubit_names
+            self._pending.update(qubit._pending)
             self._unlock()
 
+        def _empty(self, size):
+            if self._xp is np:
+                return _empty_state(size, self._dtype)
+            return self._xp.empty(size, dtype=self._dtype)
+
+        def _bit(self, qubit_name):
+            # The first qubit is the most significant bit of the basis
+            # state index, the last one the least significant bit.
+            return self.N - 1 - self._qubit_names.index(qubit_name)
+
+        def _split(self, qubit_name):
+            # View of the state vector with shape (2^(N-k-1), 2, 2^k), where
+            # the middle axis is the value of the qubit at bit position k.
+            k = self._bit(qubit_name)
+            return self.data.reshape(2 ** (self.N - k - 1), 2, 2 ** k)
+
         def apply_single_gate(self, gate, qubit_name):
-            if not isinstance(gate, qutip.Qobj):
-                raise TypeError("Gate has to be of type Qobject.")
+            """
+            Queues a single qubit gate. Consecutive gates on the same qubit
+            are multiplied and only applied to the state vector once
+            another operation needs the qubit.
+            """
             self._lock()
-            target = self._qubit_names.index(qubit_name)
-            gate = qutip.gate_expand_1toN(gate, self.N, target)
-            self.data = gate * self.data * gate.dag()
+            if self._block is not None and qubit_name in self._block[:2]:
+                first, second, ops = self._block
+                if qubit_name == first:
+                    gate = np.kron(gate, _I)
+                else:
+                    gate = np.kron(_I, gate)
+                ops.append(('gate', gate, first, second))
+                if len(ops) >= self.MAX_FUSED_GATES:
+                    self._flush_block()
+                self._unlock()
+                return
+            if qubit_name in self._pending:
+                fused, length = self._pending[qubit_name]
+                gate = gate @ fused
+                length = length + 1
+            else:
+                length = 1
+            if length >= self.MAX_FUSED_GATES:
+                self._pending.pop(qubit_name, None)
+                self._apply_single_gate(gate, qubit_name)
+            else:
+                self._pending[qubit_name] = (gate, length)
             self._unlock()
 
+        def _apply_single_gate(self, gate, qubit_name):
+            if kernels is not None and self._xp is np:
+                kernels.apply_gate(self.data, gate, self._bit(qubit_name), self.N)
+                return
+            state = self._split(qubit_name)
+            a_0 = state[:, 0, :].copy()
+            a_1 = state[:, 1, :]
+            state[:, 0, :] = gate[0, 0] * a_0 + gate[0, 1] * a_1
+            state[:, 1, :] = gate[1, 0] * a_0 + gate[1, 1] * a_1
+
+        def _flush(self, qubit_names):
+            # Applies the queued gates of the qubits to the state vector.
+            if self._block is not None:
+                if self._block[0] in qubit_names or self._block[1] in qubit_names:
+                    self._flush_block()
+            names = [name for name in qubit_names if name in self._pending]
+            if len(names) > 1 and kernels is not None and self._xp is np:
+                # one pass over the state vector for all gates
+                gates = [self._pending.pop(name)[0] for name in names]
+                ks = [self._bit(name) for name in names]
+                kernels.apply_gates(self.data, gates, ks, self.N)
+                return
+            for name in names:
+                gate, _ = self._pending.pop(name)
+                self._apply_single_gate(gate, name)
+
+        def _queue_double_gate(self, kind, gate, control_name, target_name):
+            """
+            Queues a two qubit gate. Gates acting on the same pair of qubits,
+            including single qubit gates on one of them, are multiplied and
+            applied in one pass over the state vector.
+            """
+            if self._block is not None:
+                if set(self._block[:2]) != {control_name, target_name}:
+                    self._flush_block()
+            if self._block is None:
+                ops = []
+                first, _ = self._pending.pop(control_name, (_I, 0))
+                second, _ = self._pending.pop(target_name, (_I, 0))
+                if first is not _I or second is not _I:
+                    ops.append(('gate', np.kron(first, second),
+                                control_name, target_name))
+                self._block = [control_name, target_name, ops]
+            first, second, ops = self._block
+            if control_name != first:
+                gate = _SWAP @ gate @ _SWAP
+            ops.append((kind, gate, control_name, target_name))
+            if len(ops) >= self.MAX_FUSED_GATES:
+                self._flush_block()
+
+        def _flush_block(self):
+            # Applies the queued block of two qubit gates to the state vector.
+            # A single CNOT or CPHASE is cheaper than a dense 4x4 gate.
+            if self._block is None:
+                return
+            first, second, ops = self._block
+            self._block = None
+            kind, gate, control_name, target_name = ops[0]
+            if len(ops) == 1 and kind == 'cnot':
+                self._apply_cnot(control_name, target_name)
+            elif len(ops) == 1 and kind == 'cphase':
+                self._apply_cphase(control_name, target_name)
+            else:
+                for _, next_gate, _, _ in ops[1:]:
+                    gate = next_gate @ gate
+                self._apply_double_gate(gate, first, second)
+
         def apply_double_gate(self, gate, control_name, target_name):
-            if not isinstance(gate, qutip.Qobj):
-                raise TypeError("Gate has to be of type Qobject.")
             self._lock()
-            control = self._qubit_names.index(control_name)
-            target = self._qubit_names.index(target_name)
-            gate = qutip.gate_expand_2toN(gate, self.N, control, target)
-            self.data = gate * self.data * gate.dag()
+            self._queue_double_gate('gate', gate, control_name, target_name)
             self._unlock()
 
+        def _apply_double_gate(self, gate, control_name, target_name):
+            k_c = self._bit(control_name)
+            k_t = self._bit(target_name)
+            if kernels is not None and self._xp is np:
+                kernels.apply_2q(self.data, gate, k_c, k_t, self.N)
+                return
+            # View of shape (A, 2, B, 2, C) with the two qubits on the size 2
+            # axes, the gate only mixes amplitudes along these axes.
+            high, low = max(k_c, k_t), min(k_c, k_t)
+            state = self.data.reshape(2 ** (self.N - high - 1), 2,
+                                      2 ** (high - low - 1), 2, 2 ** low)
+            gate = self._xp.asarray(gate).reshape(2, 2, 2, 2)
+            if k_c == high:
+                state[...] = self._xp.einsum('xyij,aibjc->axbyc', gate, state)
+            else:
+                state[...] = self._xp.einsum('xyij,ajbic->aybxc', gate, state)
+
+        def _controlled_views(self, control_name, target_name):
+            # Views of the amplitudes where the control qubit is 1 and the
+            # target qubit is 0 respectively 1. Only basic slicing is used,
+            # so both are views into the state vector.
+            k_c = self._bit(control_name)
+            k_t = self._bit(target_name)
+            high, low = max(k_c, k_t), min(k_c, k_t)
+            state = self.data.reshape(2 ** (self.N - high - 1), 2,
+                                      2 ** (high - low - 1), 2, 2 ** low)
+            index = [slice(None)] * 5
+            index[1 if k_c == high else 3] = 1
+            target_axis = 1 if k_t == high else 3
+            index[target_axis] = 0
+            target_0 = state[tuple(index)]
+            index[target_axis] = 1
+            target_1 = state[tuple(index)]
+            return target_0, target_1
+
+        def apply_cnot(self, control_name, target_name):
+            self._lock()
+            self._queue_double_gate('cnot', _CNOT, control_name, target_name)
+            self._unlock()
+
+        def _apply_cnot(self, control_name, target_name):
+            target_0, target_1 = self._controlled_views(control_name, target_name)
+            tmp = target_0.copy()
+            target_0[...] = target_1
+            target_1[...] = tmp
+
+        def apply_cphase(self, control_name, target_name):
+            self._lock()
+            self._queue_double_gate('cphase', _CPHASE, control_name, target_name)
+            self._unlock()
+
+        def _apply_cphase(self, control_name, target_name):
+            _, target_1 = self._controlled_views(control_name, target_name)
+            self._xp.negative(target_1, out=target_1)
+
         def measure(self, qubit_name, non_destructive):
-            res = None
-            M_0 = qutip.fock(2, 0).proj()
-            M_1 = qutip.fock(2, 1).proj()
             self._lock()
-            target = self._qubit_names.index(qubit_name)
-            if self.N > 1:
-                M_0 = qutip.gate_expand_1toN(M_0, self.N, target)
-                M_1 = qutip.gate_expand_1toN(M_1, self.N, target)
-            pr_0 = qutip.expect(M_0, self.data)
-            pr_1 = qutip.expect(M_1, self.data)
-            outcome = int(np.random.choice([0, 1], 1, p=[pr_0, pr_1]))
-            if outcome == 0:
-                self.data = M_0 * self.data * M_0.dag() / pr_0
-                res = 0
-            else:
-                # M_1 = qutip.gate_expand_1toN(M_1, self.N, target)
-                self.data = M_1 * self.data * M_1.dag() / pr_1
-                res = 1
+            self._flush([qubit_name])
+            state = self._split(qubit_name)
+            # The probability of 1 is the sum of the squared real and
+            # imaginary parts where the qubit is 1, read from a real view
+            # without temporary arrays.
+            parts = self.data.view(self.data.real.dtype)
+            parts = parts.reshape(state.shape[0], 2, 2 * state.shape[2])[:, 1, :]
+            pr_1 = float(self._xp.einsum('ab,ab->', parts, parts))
+            pr_1 = min(max(pr_1, 0.0), 1.0)
+            pr_0 = 1.0 - pr_1
+            res = int(np.random.random_sample() < pr_1)
+            norm = np.sqrt(pr_1 if res == 1 else pr_0)
             if non_destructive is False:
-                i_list = [x for x in range(self.N)]
-                i_list.remove(target)
+                data = self._empty(self.data.size // 2)
+                self._xp.divide(state[:, res, :], norm,
+                                out=data.reshape(state.shape[0], state.shape[2]))
+                self.data = data
                 self._qubit_names.remove(qubit_name)
                 self.N = self.N - 1
-                if len(i_list) > 0:
-                    self.data = self.data.ptrace(i_list)
-                else:
-                    self.data = qutip.Qobj()
+            else:
+                state[:, 1 - res, :] = 0
+                state[:, res, :] *= 1 / norm
             self._unlock()
             return res
 
@@ -105,13 +370,37 @@ class QuTipBackend(object):
                 for q_name in qubit_name:
                     if q_name in self._qubit_names:
                         indices.append(self._qubit_names.index(q_name))
-                ret = self.data.ptrace(indices)
+                self._flush(qubit_name)
+                ret = self._ptrace(indices)
             else:
                 if qubit_name in self._qubit_names:
                     index = self._qubit_names.index(qubit_name)
-                    ret = self.data.ptrace([index])
+                    self._flush([qubit_name])
+                    ret = self._ptrace([index])
             self._unlock()
-            return self.data #ret
+            return ret
+
+        def _ptrace(self, indices):
+            # Reduced density matrix of the qubits at the given positions,
+            # ordered like the qubits in the collection.
+            xp = self._xp
+            indices = sorted(indices)
+            if len(indices) == self.N:
+                # nothing to trace out, |psi><psi|
+                rho = xp.empty((self.data.size, self.data.size), dtype=self._dtype)
+                xp.multiply(self.data[:, None], self.data.conj()[None, :], out=rho)
+            elif len(indices) == 1:
+                state = self._split(self._qubit_names[indices[0]])
+                rho = xp.einsum('aib,ajb->ij', state, state.conj())
+            else:
+                traced = [i for i in range(self.N) if i not in indices]
+                state = self.data.reshape((2,) * self.N)
+                rho = xp.tensordot(state, state.conj(), axes=(traced, traced))
+                dim = 2 ** len(indices)
+                rho = rho.reshape(dim, dim)
+            if xp is not np:
+                rho = rho.get()
+            return rho
 
         def _lock(self):
             self._rwlock.acquire_write()
@@ -119,50 +408,48 @@ class QuTipBackend(object):
         def _unlock(self):
             self._rwlock.release_write()
 
-    class Hosts(SafeDict):
-        # There only should be one instance of Hosts
-        __instance = None
-
-        @staticmethod
-        def get_instance():
-            if QuTipBackend.Hosts.__instance is not None:
-                return QuTipBackend.Hosts.__instance
-            else:
-                return QuTipBackend.Hosts()
-
-        def __init__(self):
-            if QuTipBackend.Hosts.__instance is not None:
-                raise Exception("Call get instance to get this class!")
-            QuTipBackend.Hosts.__instance = self
-            SafeDict.__init__(self)
-
-    class EntanglementIDs(SafeDict):
-        # There only should be one instance of Hosts
-        __instance = None
-
-        @staticmethod
-        def get_instance():
-            if QuTipBackend.EntanglementIDs.__instance is not None:
-                return QuTipBackend.EntanglementIDs.__instance
-            else:
-                return QuTipBackend.EntanglementIDs()
-
-        def __init__(self):
-            if QuTipBackend.EntanglementIDs.__instance is not None:
-                raise Exception("Call get instance to get this class!")
-            QuTipBackend.EntanglementIDs.__instance = self
-            SafeDict.__init__(self)
+    def __init__(self, device='cpu', dtype=np.complex128):
+        """
+        If numba is installed and no threading layer is set in the
+        environment, numba is made to prefer OpenMP over TBB for the whole
+        process, see _qutip_kernels.prefer_threading_layers.
 
-    def __init__(self):
-        self._hosts = QuTipBackend.Hosts.get_instance()
-        self._entaglement_qubits = QuTipBackend.EntanglementIDs.get_instance()
+        Args:
+            device (str): 'cpu' to keep the state vectors in host memory or
+                          'cuda' to keep them on the GPU, which needs cupy.
+            dtype (np.dtype): Type of the amplitudes, np.complex128 or
+                              np.complex64. Single precision halves the memory
+                              of a state and is enough for coarse fidelities
+                              of larger networks.
+        """
+        if dtype not in (np.complex128, np.complex64):
+            raise ValueError("Dtype has to be np.complex128 or np.complex64.")
+        self._dtype = dtype
+        if kernels is not None:
+            kernels.prefer_threading_layers()
+        if device == 'cpu':
+            self._xp = np
+        elif device == 'cuda':
+            if cupy is None:
+                raise RuntimeError(
+                    'To use the QuTip backend on a GPU, you need to first install '
+                    'the Python package \'cupy\' (e.g. run \'pip install cupy\'.')
+            self._xp = cupy
+        else:
+            raise ValueError("Device has to be 'cpu' or 'cuda'.")
+        self._hosts = _hosts
+        self._entaglement_qubits = _entanglement_qubits
 
     def start(self, **kwargs):
         """
         Starts Backends which have to run in an own thread or process before they
         can be used.
+
+        If numba is installed, measures once from which state size on the
+        parallel gate kernels are faster on this machine.
         """
-        pass
+        if kernels is not None:
+            kernels.tune_thresholds()
 
     def stop(self):
         """
@@ -190,7 +477,7 @@ class QuTipBackend(object):
             Qubit of backend type.
         """
         name = str(uuid.uuid4())
-        return (QuTipBackend.QubitCollection(name), name)
+        return (QuTipBackend.QubitCollection(name, self._xp, self._dtype), name)
 
     def send_qubit_to(self, qubit, from_host_id, to_host_id):
         """
@@ -221,12 +508,10 @@ class QuTipBackend(object):
         name2 = str(uuid.uuid4())
         host_a = self._hosts.get_from_dict(host_a_id)
         host_b = self._hosts.get_from_dict(host_b_id)
-        qubit1 = (QuTipBackend.QubitCollection(name1), name1)
-        qubit2 = (QuTipBackend.QubitCollection(name2), name2)
-        qubit1[0].apply_single_gate(snot(), qubit1[1])
-        qubit1[0].add_qubit(qubit2[0])
-        qubit2 = (qubit1[0], name2)
-        qubit1[0].apply_double_gate(cnot(), qubit1[1], qubit2[1])
+        qubit_collection = QuTipBackend.QubitCollection.from_state(
+            [name1, name2], _BELL, self._xp, self._dtype)
+        qubit1 = (qubit_collection, name1)
+        qubit2 = (qubit_collection, name2)
         q1 = Qubit(host_a, qubit=qubit1, q_id=q_id, blocked=block)
         q2 = Qubit(host_b, qubit=qubit2, q_id=q1.id, blocked=block)
         self.store_ent_pair(host_a.host_id, host_b.host_id, q2)
@@ -237,10 +522,10 @@ class QuTipBackend(object):
         ent_queue = self._entaglement_qubits.get_from_dict(key)
 
         if ent_queue is not None:
-            ent_queue.put(qubit)
+            ent_queue.append(qubit)
         else:
-            ent_queue = Queue()
-            ent_queue.put(qubit)
+            ent_queue = deque()
+            ent_queue.append(qubit)
         self._entaglement_qubits.add_to_dict(key, ent_queue)
 
     def receive_epr(self, host_id, sender_id, q_id=None, block=False):
@@ -257,9 +542,10 @@ class QuTipBackend(object):
         """
         key = sender_id + ':' + host_id
         ent_queue = self._entaglement_qubits.get_from_dict(key)
-        if ent_queue is None:
+        # create_EPR stores the qubit before the sender announces the pair
+        if not ent_queue:
             raise Exception("Internal Error!")
-        q = ent_queue.get()
+        q = ent_queue.popleft()
         self._entaglement_qubits.add_to_dict(key, ent_queue)
         if q_id is not None and q_id != q.id:
             raise ValueError("Qid doesent match id!")
@@ -285,9 +571,8 @@ class QuTipBackend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        gate = rx(np.pi)
         qubit_collection, name = qubit.qubit
-        qubit_collection.apply_single_gate(gate, name)
+        qubit_collection.apply_single_gate(_X, name)
 
     def Y(self, qubit):
         """
@@ -296,9 +581,8 @@ class QuTipBackend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        gate = ry(np.pi)
         qubit_collection, name = qubit.qubit
-        qubit_collection.apply_single_gate(gate, name)
+        qubit_collection.apply_single_gate(_Y, name)
 
     def Z(self, qubit):
         """
@@ -307,9 +591,8 @@ class QuTipBackend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        gate = rz(np.pi)
         qubit_collection, name = qubit.qubit
-        qubit_collection.apply_single_gate(gate, name)
+        qubit_collection.apply_single_gate(_Z, name)
 
     def H(self, qubit):
         """
@@ -318,9 +601,8 @@ class QuTipBackend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        gate = snot()
         qubit_collection, name = qubit.qubit
-        qubit_collection.apply_single_gate(gate, name)
+        qubit_collection.apply_single_gate(_H, name)
 
     def T(self, qubit):
         """
@@ -329,8 +611,8 @@ class QuTipBackend(object):
         Args:
             qubit (Qubit): Qubit on which gate should be applied to.
         """
-        gate = np.array([[1, 0], [0, np.e ** (1j * np.pi / 4)]])
-        self.custom_gate(qubit, gate)
+        qubit_collection, name = qubit.qubit
+        qubit_collection.apply_single_gate(_T, name)
 
     def rx(self, qubit, phi):
         """
@@ -340,7 +622,7 @@ class QuTipBackend(object):
             qubit (Qubit): Qubit on which gate should be applied to.
             phi (float): Amount of rotation in Rad.
         """
-        gate = rx(phi)
+        gate = _rotation('x', phi)
         qubit_collection, name = qubit.qubit
         qubit_collection.apply_single_gate(gate, name)
 
@@ -352,7 +634,7 @@ class QuTipBackend(object):
             qubit (Qubit): Qubit on which gate should be applied to.
             phi (float): Amount of rotation in Rad.
         """
-        gate = ry(phi)
+        gate = _rotation('y', phi)
         qubit_collection, name = qubit.qubit
         qubit_collection.apply_single_gate(gate, name)
 
@@ -364,7 +646,7 @@ class QuTipBackend(object):
             qubit (Qubit): Qubit on which gate should be applied to.
             phi (float): Amount of rotation in Rad.
         """
-        gate = rz(phi)
+        gate = _rotation('z', phi)
         qubit_collection, name = qubit.qubit
         qubit_collection.apply_single_gate(gate, name)
 
@@ -376,13 +658,12 @@ class QuTipBackend(object):
             qubit (Qubit): Qubit to control cnot.
             target (Qubit): Qubit on which the cnot gate should be applied.
         """
-        gate = cnot()
         qubit_collection, c_name = qubit.qubit
         qubit_collection2, t_name = target.qubit
         if qubit_collection != qubit_collection2:
             qubit_collection.add_qubit(qubit_collection2)
             target.qubit = (qubit_collection, t_name)
-        qubit_collection.apply_double_gate(gate, c_name, t_name)
+        qubit_collection.apply_cnot(c_name, t_name)
 
     def cphase(self, qubit, target):
         """
@@ -392,13 +673,12 @@ class QuTipBackend(object):
             qubit (Qubit): Qubit to control cphase.
             target (Qubit): Qubit on which the cphase gate should be applied.
         """
-        gate = csign()
         qubit_collection, c_name = qubit.qubit
         qubit_collection2, t_name = target.qubit
         if qubit_collection != qubit_collection2:
             qubit_collection.add_qubit(qubit_collection2)
             target.qubit = (qubit_collection, t_name)
-        qubit_collection.apply_double_gate(gate, c_name, t_name)
+        qubit_collection.apply_cphase(c_name, t_name)
 
     def custom_gate(self, qubit, gate):
         """
@@ -408,7 +688,10 @@ class QuTipBackend(object):
             qubit(Qubit): Qubit to which the gate is applied.
             gate(np.ndarray): 2x2 array of the gate.
         """
-        gate = qutip.Qobj(gate)
+        # copied, the gate is only applied once the qubit is needed
+        gate = np.array(gate, dtype=np.complex128)
+        if gate.shape != (2, 2):
+            raise ValueError("Gate has to be a 2x2 array.")
         qubit_collection, name = qubit.qubit
         qubit_collection.apply_single_gate(gate, name)
 
@@ -433,7 +716,7 @@ class QuTipBackend(object):
             target_2 (Qubit): Qubit on which the gate is applied.
             gate (nd.array): 4x4 array for the gate applied to target.
         """
-        raise (EnvironmentError("Not implemeted for this backend!"))
+        raise (EnvironmentError("Not implemented for this backend!"))
 
     def custom_two_qubit_gate(self, qubit1, qubit2, gate):
         """
@@ -444,7 +727,10 @@ class QuTipBackend(object):
             qubit2(Qubit): Second qubit of the gate.
             gate(np.ndarray): 4x4 array for the gate applied.
         """
-        gate = qutip.Qobj(gate)
+        # copied, the gate is only applied once the qubits are needed
+        gate = np.array(gate, dtype=np.complex128)
+        if gate.shape != (4, 4):
+            raise ValueError("Gate has to be a 4x4 array.")
         qubit_collection, c_name = qubit1.qubit
         qubit_collection2, t_name = qubit2.qubit
         if qubit_collection != qubit_collection2:
@@ -499,5 +785,4 @@ class QuTipBackend(object):
         Args:
             qubit (Qubit): The qubit which should be released.
         """
-        raise (EnvironmentError("This is only an interface, not \
-                        an actual implementation!"))
+        self.measure(qubit, False)